@@ -5,6 +5,7 @@ Pick a video (8640×3840), set bezel width, click Process. Output saved next to
 
 import sys
 import threading
+from collections import deque
 from pathlib import Path
 from typing import Optional
 
@@ -23,7 +24,13 @@ if getattr(sys, "frozen", False):
 import customtkinter as ctk
 
 from bezel_processor import (
+    ffprobe_beside,
     get_ffmpeg_path,
+    get_nvdec_codecs,
+    get_nvenc_encoders,
+    get_video_size_codec,
+    nvdec_can_decode,
+    nvenc_usable,
     output_path,
     run as run_bezel_removal,
 )
@@ -34,8 +41,14 @@ CTK_FONT_FAMILY = "Helvetica"
 DEFAULT_TOP_BEZEL_PX = 16
 DEFAULT_BOTTOM_BEZEL_PX = 21
 WINDOW_MIN_WIDTH = 520
-# Min height: header (72) + main padding (48) + settings card (~220) + gap (10) + progress card (title + bar + status + result + log ~220)
-WINDOW_MIN_HEIGHT = 850
+# Min height: header (72) + main padding (48) + settings card (~280) + gap (10) + progress card (title + bar + status + result + log ~220)
+WINDOW_MIN_HEIGHT = 910
+# Worker progress is applied to the UI at most once per interval (one redraw regardless of FFmpeg output rate)
+PROGRESS_FLUSH_MS = 100
+# Log box keeps only the most recent lines (Tk Text reflow cost grows with its contents)
+LOG_MAX_LINES = 200
+# Skip progress bar redraws for changes smaller than this (fraction of the bar; 0.005 = 0.5%)
+PROGRESS_MIN_STEP = 0.005
 
 # Styling (Figma-to-HTML–style: dark header, light body, white cards, purple primary)
 COLOR_HEADER_BG = "#1A1A1A"
@@ -67,11 +80,26 @@ class BezelRemoverApp(ctk.CTk):
         self.after(100, self._bring_to_front)
 
         self.input_path: Optional[Path] = None
+        self._input_codec: Optional[str] = None
+        self._input_size: Optional[tuple[int, int]] = None
+        self._ffmpeg_path: Optional[str] = None
+        self._nvdec_codecs: set[str] = set()
+        self._nvenc_encoders: set[str] = set()
         self._processing = False
         self._progress_thread: Optional[threading.Thread] = None
         self._last_log_message: Optional[str] = None
+        # Written by the worker thread, read by _flush_progress on the Tk thread (plain attributes; GIL is enough)
+        self._pending_percent = 0.0
+        self._pending_message: Optional[str] = None
+        self._pending_log: deque[str] = deque()
+        self._flush_after_id: Optional[str] = None
+        self._log_lines: deque[str] = deque(maxlen=LOG_MAX_LINES)
+        self._log_dirty = False
+        self._last_progress_set = 0.0
 
         self._build_ui()
+        # Probe FFmpeg off the Tk thread so the window paints without waiting for it
+        threading.Thread(target=self._probe_ffmpeg, daemon=True).start()
 
     def _build_ui(self):
         # —— Header (full-width dark bar) ——
@@ -184,6 +212,11 @@ class BezelRemoverApp(ctk.CTk):
         )
         self._bottom_bezel_entry.grid(row=row, column=1, sticky="e", **pad_header)
         row += 1
+        # Validate as the user types; _process reads the cached ints
+        self._top_bezel_int: Optional[int] = DEFAULT_TOP_BEZEL_PX
+        self._bottom_bezel_int: Optional[int] = DEFAULT_BOTTOM_BEZEL_PX
+        self._top_bezel_var.trace_add("write", self._validate_bezel)
+        self._bottom_bezel_var.trace_add("write", self._validate_bezel)
         ctk.CTkLabel(
             card,
             text="Right edge of each panel (e.g. 21 for 21mm)",
@@ -206,7 +239,7 @@ class BezelRemoverApp(ctk.CTk):
             card,
             values=["100 MB", "200 MB", "500 MB", "Best quality"],
             variable=self._target_size_var,
-            width=140,
+            width=200,
             corner_radius=8,
             fg_color=COLOR_INPUT_BG,
             dropdown_fg_color=COLOR_INPUT_BG,
@@ -219,7 +252,41 @@ class BezelRemoverApp(ctk.CTk):
         row += 1
         ctk.CTkLabel(
             card,
-            text="Shorter videos get higher quality within the limit; Best quality uses fixed bitrate.",
+            text=(
+                "Shorter videos get higher quality within the limit. Best quality: CRF 18 capped at 10 Mbps "
+                "on CPU, 10 Mbps VBR on GPU."
+            ),
+            justify="left",
+            wraplength=420,
+            text_color=COLOR_TEXT_MUTED,
+            font=(CTK_FONT_FAMILY, 12),
+        ).grid(row=row, column=0, columnspan=2, sticky="w", **pad_secondary)
+        row += 1
+
+        # Encoder (CPU x264 or NVIDIA GPU; GPU option is disabled when FFmpeg has no CUDA support)
+        ctk.CTkLabel(
+            card, text="Encoder", font=(CTK_FONT_FAMILY, 14, "bold"), text_color=COLOR_TEXT_TITLE
+        ).grid(row=row, column=0, sticky="w", **pad_header)
+        self._use_gpu_var = ctk.StringVar(value="CPU (x264)")
+        self._use_gpu_menu = ctk.CTkOptionMenu(
+            card,
+            values=["CPU (x264)", "NVIDIA GPU (NVENC)"],
+            variable=self._use_gpu_var,
+            command=self._on_encoder_change,
+            width=200,
+            corner_radius=8,
+            fg_color=COLOR_INPUT_BG,
+            dropdown_fg_color=COLOR_INPUT_BG,
+            button_color=COLOR_SECONDARY_BG,
+            button_hover_color="#D0D0D0",
+            text_color=COLOR_TEXT_TITLE,
+            dropdown_text_color=COLOR_TEXT_TITLE,
+        )
+        self._use_gpu_menu.grid(row=row, column=1, sticky="e", **pad_header)
+        row += 1
+        ctk.CTkLabel(
+            card,
+            text="NVIDIA GPU is much faster; CPU gives the best 4:2:2 10-bit quality.",
             text_color=COLOR_TEXT_MUTED,
             font=(CTK_FONT_FAMILY, 12),
         ).grid(row=row, column=0, columnspan=2, sticky="w", **pad_secondary)
@@ -258,7 +325,7 @@ class BezelRemoverApp(ctk.CTk):
         row2 += 1
         self._progress_var = ctk.DoubleVar(value=0.0)
         self._progress_bar = ctk.CTkProgressBar(
-            card2, variable=self._progress_var, progress_color=COLOR_PRIMARY
+            card2, variable=self._progress_var, progress_color=COLOR_PRIMARY, mode="determinate"
         )
         self._progress_bar.grid(row=row2, column=0, columnspan=2, sticky="ew", **pad)
         row2 += 1
@@ -289,14 +356,48 @@ class BezelRemoverApp(ctk.CTk):
         card2.columnconfigure(0, weight=1)
         card2.rowconfigure(row2 - 1, weight=1)
 
-        # FFmpeg check (bundled or PATH)
-        if not get_ffmpeg_path():
+        # GPU encoder stays disabled until the FFmpeg probe (_probe_ffmpeg) confirms CUDA support
+        self._use_gpu_menu.configure(state="disabled")
+
+    def _probe_ffmpeg(self):
+        """Background thread: locate FFmpeg and read its capabilities, then apply the result on the Tk thread."""
+        ffmpeg_path = get_ffmpeg_path()
+        # Build lists alone aren't enough (full builds list NVENC without an NVIDIA GPU): nvenc_usable test-encodes
+        # one frame with hevc_nvenc (h264_nvenc can't do the 4320 px wide output)
+        gpu_ok = bool(ffmpeg_path) and nvenc_usable(ffmpeg_path)
+        nvenc_encoders = get_nvenc_encoders(ffmpeg_path) if gpu_ok else set()
+        # Input codecs NVDEC can handle; others fall back to CPU decode (see _process)
+        nvdec_codecs = get_nvdec_codecs(ffmpeg_path) if gpu_ok else set()
+        self.after(0, self._apply_ffmpeg_state, ffmpeg_path, gpu_ok, nvdec_codecs, nvenc_encoders)
+
+    def _apply_ffmpeg_state(
+        self, ffmpeg_path: Optional[str], gpu_ok: bool, nvdec_codecs: set[str], nvenc_encoders: set[str]
+    ):
+        """FFmpeg check (bundled or PATH); GPU encoder only offered when a test hevc_nvenc encode succeeded."""
+        self._ffmpeg_path = ffmpeg_path
+        self._nvdec_codecs = nvdec_codecs
+        self._nvenc_encoders = nvenc_encoders
+        if not ffmpeg_path:
             self._status_var.set("FFmpeg not found. Please install FFmpeg.")
             self._process_btn.configure(
                 state="disabled",
                 fg_color=COLOR_BUTTON_DISABLED_BG,
                 text_color=COLOR_BUTTON_DISABLED_TEXT,
             )
+        if gpu_ok:
+            self._use_gpu_menu.configure(state="normal")
+        else:
+            self._use_gpu_var.set("CPU (x264)")
+        self._on_encoder_change(self._use_gpu_var.get())
+
+    def _on_encoder_change(self, choice: str):
+        """Offer "Best quality (10-bit HEVC)" only with the GPU encoder and an FFmpeg that has hevc_nvenc."""
+        values = ["100 MB", "200 MB", "500 MB", "Best quality"]
+        if choice == "NVIDIA GPU (NVENC)" and "hevc_nvenc" in self._nvenc_encoders:
+            values.append("Best quality (10-bit HEVC)")
+        elif self._target_size_var.get() == "Best quality (10-bit HEVC)":
+            self._target_size_var.set("Best quality")
+        self._target_size_menu.configure(values=values)
 
     def _bring_to_front(self):
         """Raise window and focus (helps when launched from Finder)."""
@@ -306,7 +407,21 @@ class BezelRemoverApp(ctk.CTk):
         except Exception:
             pass
 
+    def _validate_bezel(self, *_):
+        """Keystroke check for both bezel entries: cache the value (None if not digits) and mark bad input red."""
+        for var, entry, attr in (
+            (self._top_bezel_var, self._top_bezel_entry, "_top_bezel_int"),
+            (self._bottom_bezel_var, self._bottom_bezel_entry, "_bottom_bezel_int"),
+        ):
+            text = var.get().strip()
+            valid = text.isascii() and text.isdigit()
+            setattr(self, attr, int(text) if valid else None)
+            entry.configure(border_color="#E0E0E0" if valid else "#C53030")
+
     def _browse(self):
+        # The worker reads self.input_path; never swap it mid-encode
+        if self._processing:
+            return
         path = ctk.filedialog.askopenfilename(
             title="Select video file",
             filetypes=[
@@ -316,6 +431,10 @@ class BezelRemoverApp(ctk.CTk):
         )
         if path:
             self.input_path = Path(path)
+            # Codec and frame size decide whether NVDEC can decode it (see _process); MP4/MOV need no ffprobe run
+            self._input_size, self._input_codec = get_video_size_codec(
+                self.input_path, ffprobe_path=ffprobe_beside(self._ffmpeg_path)
+            )
             self._path_var.set(self.input_path.name)
             self._result_var.set("")
             self._progress_var.set(0.0)
@@ -327,10 +446,9 @@ class BezelRemoverApp(ctk.CTk):
         if not self.input_path or not self.input_path.is_file():
             self._status_var.set("Please select a video file first.")
             return
-        try:
-            top_bezel_px = int(self._top_bezel_var.get().strip())
-            bottom_bezel_px = int(self._bottom_bezel_var.get().strip())
-        except ValueError:
+        top_bezel_px = self._top_bezel_int
+        bottom_bezel_px = self._bottom_bezel_int
+        if top_bezel_px is None or bottom_bezel_px is None:
             self._status_var.set("Top and bottom bezel must be numbers (e.g. 16, 21).")
             return
         if top_bezel_px < 0 or bottom_bezel_px < 0 or top_bezel_px + bottom_bezel_px > 1000:
@@ -345,7 +463,20 @@ class BezelRemoverApp(ctk.CTk):
             target_size_mb = 200.0
         elif choice == "500 MB":
             target_size_mb = 500.0
-        # "Best quality" -> None
+        # "Best quality" / "Best quality (10-bit HEVC)" -> None
+        use_gpu = self._use_gpu_var.get() == "NVIDIA GPU (NVENC)"
+        hevc_10bit = use_gpu and choice == "Best quality (10-bit HEVC)"
+        # GPU encode still works with CPU decode; unconditional -hwaccel cuda on e.g. AV1 with an older card
+        # produces an empty output without an error, and H.264 over 4096 px (the usual 8640×3840 composite) fails,
+        # so only decode on the GPU for codecs NVDEC reports at a size it supports
+        gpu_decode = True
+        decode_notice = None
+        if use_gpu and not nvdec_can_decode(self._input_codec, self._input_size, self._nvdec_codecs):
+            gpu_decode = False
+            codec_label = self._input_codec.upper() if self._input_codec else "this video"
+            if self._input_codec in self._nvdec_codecs and self._input_size:
+                codec_label = f"{self._input_size[0]}×{self._input_size[1]} {codec_label}"
+            decode_notice = f"GPU cannot decode {codec_label} on this card; using CPU decode."
 
         out = output_path(self.input_path)
         self._processing = True
@@ -354,20 +485,29 @@ class BezelRemoverApp(ctk.CTk):
             fg_color=COLOR_BUTTON_DISABLED_BG,
             text_color=COLOR_BUTTON_DISABLED_TEXT,
         )
+        self._browse_btn.configure(state="disabled")
         self._progress_var.set(0.0)
+        self._last_progress_set = 0.0
         self._status_var.set("Starting...")
         self._result_var.set("")
         self._last_log_message = None
-        try:
-            self._log_text.configure(state="normal")
-            self._log_text.delete("1.0", "end")
-            self._log_text.configure(state="disabled")
-        except Exception:
-            pass
+        self._pending_percent = 0.0
+        self._pending_message = None
+        self._pending_log.clear()
+        self._log_lines.clear()
         self._append_log("Starting…")
+        if decode_notice:
+            self._status_var.set(decode_notice)
+            self._append_log(decode_notice)
+        self._render_log()
 
         def progress_callback(percent: float, message: str):
-            self.after(0, lambda p=percent, m=message: self._update_progress(p, m))
+            # Worker thread: only record the latest state; _flush_progress applies it on the Tk thread
+            if message != self._last_log_message:
+                self._last_log_message = message
+                self._pending_log.append(message)
+            self._pending_percent = percent
+            self._pending_message = message
 
         ffmpeg_path = get_ffmpeg_path()
 
@@ -383,43 +523,75 @@ class BezelRemoverApp(ctk.CTk):
                     target_size_mb=target_size_mb,
                     ffmpeg_path=ffmpeg_path,
                     progress_callback=progress_callback,
+                    encoder="nvenc" if use_gpu else "libx264",
+                    gpu_decode=gpu_decode,
+                    hevc_10bit=hevc_10bit,
                 )
             except Exception as e:
                 err = e
             self.after(0, lambda r=res, e=err: self._finish(result=r, error=e))
 
         threading.Thread(target=run_safe, daemon=True).start()
+        self._flush_after_id = self.after(PROGRESS_FLUSH_MS, self._flush_progress)
 
     def _append_log(self, line: str):
+        """Queue a log line (bounded to LOG_MAX_LINES); _render_log draws it."""
         if not line:
             return
+        self._log_lines.append(line.rstrip())
+        self._log_dirty = True
+
+    def _render_log(self):
+        """Redraw the log box from _log_lines, only if lines were added since the last redraw."""
+        if not self._log_dirty:
+            return
+        self._log_dirty = False
         try:
             self._log_text.configure(state="normal")
-            self._log_text.insert("end", line.rstrip() + "\n")
+            self._log_text.delete("1.0", "end")
+            self._log_text.insert("1.0", "\n".join(self._log_lines) + "\n")
             self._log_text.see("end")
             self._log_text.configure(state="disabled")
         except Exception:
             pass
 
+    def _flush_progress(self):
+        """Apply the latest worker progress (coalesced timer); reschedules itself while processing."""
+        self._flush_after_id = None
+        # Log: one line per message change (recorded by progress_callback), not one per %
+        while self._pending_log:
+            self._append_log(self._pending_log.popleft())
+        self._render_log()
+        if self._pending_message is not None:
+            self._update_progress(self._pending_percent, self._pending_message)
+            self._pending_message = None
+        if self._processing:
+            self._flush_after_id = self.after(PROGRESS_FLUSH_MS, self._flush_progress)
+
     def _update_progress(self, percent: float, message: str):
-        self._progress_var.set(percent / 100.0)
+        # Each set() redraws the bar's canvas; skip changes too small to see
+        fraction = percent / 100.0
+        if abs(fraction - self._last_progress_set) >= PROGRESS_MIN_STEP:
+            self._progress_var.set(fraction)
+            self._last_progress_set = fraction
         # Status line: message and percent when meaningful
         if percent is not None and 0 < percent < 100:
             self._status_var.set(f"{message}  {round(percent)}%")
         else:
             self._status_var.set(message)
-        # Log: append when message changes (avoid duplicate lines for every %)
-        if message != self._last_log_message:
-            self._last_log_message = message
-            self._append_log(message)
 
     def _finish(self, result=None, error=None):
         self._processing = False
+        # Stop the flush timer and apply anything the worker reported since the last tick
+        if self._flush_after_id is not None:
+            self.after_cancel(self._flush_after_id)
+        self._flush_progress()
         self._process_btn.configure(
             state="normal",
             fg_color=COLOR_PRIMARY,
             text_color="white",
         )
+        self._browse_btn.configure(state="normal")
         if error:
             msg = str(error)
             # Only show generic message for the specific "no binary" error; show real error otherwise
@@ -429,7 +601,7 @@ class BezelRemoverApp(ctk.CTk):
                 msg = msg  # Keep exact message: "Input video must be 8640×3840. This video is W×H."
             elif "FileNotFoundError" in type(error).__name__:
                 msg = "Could not find the video file. Is the path correct?"
-            elif "FFmpeg pass" in msg and "failed" in msg:
+            elif msg.startswith("FFmpeg ") and "failed" in msg:
                 msg = "Encoding failed. " + msg
             else:
                 msg = "Something went wrong. " + msg
@@ -446,6 +618,7 @@ class BezelRemoverApp(ctk.CTk):
             self._result_label.configure(text_color="#2D7D46")
             self._append_log("Done.")
             self._append_log(f"Saved as: {out_name}")
+        self._render_log()
 
 
 def main():
@@ -3,15 +3,26 @@ Bezel removal for 4-panel videowall (portrait: 2160×3840 per panel, horizontal
 Supports two input layouts:
 - Horizontal composite (8640×3840): panels are vertical strips side-by-side; split by width.
 - Vertical stack (3840×8640): panels are horizontal bands top-to-bottom; split by height, rotate each band 90° CCW, then crop/hstack.
-Uses two-pass H.264 encoding: high422, yuv422p10le, 10000k, tune animation.
+Uses H.264 encoding: high422, yuv422p10le, 10000k, tune animation (two-pass for target sizes on clips ≥ 30 s, otherwise single pass).
+Optional NVIDIA GPU path: CUDA decode + single-pass hevc_nvenc (8-bit 4:2:0 Main; NVENC has no 4:2:2, and
+h264_nvenc stops at 4096 px wide), or hevc_nvenc Main10 at constant quality for "Best quality (10-bit HEVC)".
 """
 
-import re
+import functools
+import json
+import os
 import shutil
+import struct
 import subprocess
 import sys
+import tempfile
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional, Union
+from typing import Callable, Optional, Union
 
 
 # Expected input size: 4 panels × 2160 wide, 3840 tall
@@ -24,6 +35,12 @@ PANEL_COUNT = 4
 OUTPUT_WIDTH = 4320
 OUTPUT_HEIGHT = 1920  # 4320/1920 = 8640/3840 = 2.25
 
+# Per-panel output (run_panels): one display's share of the output canvas
+PANEL_OUTPUT_WIDTH = OUTPUT_WIDTH // PANEL_COUNT
+# Cores per libx264 encode when several run at once: run_panels / run_batch run cpu_count // this encodes,
+# each with -threads CORES_PER_ENCODE
+CORES_PER_ENCODE = 4
+
 # Two-pass encode settings (videowall-quality)
 ENCODE_PIX_FMT = "yuv422p10le"
 ENCODE_PROFILE = "high422"
@@ -33,8 +50,75 @@ ENCODE_BITRATE = "10000k"
 ENCODE_BITRATE_MIN_K = 1000
 ENCODE_BITRATE_MAX_K = 50000
 ENCODE_TUNE = "animation"
+# Trim medium/animation's costlier analysis: ref 6 → 2 (medium's 3, doubled by tune animation) and subme 7 → 6;
+# at videowall bitrates the difference isn't visible. Same on every pass, so two-pass stats stay valid.
+ENCODE_X264_PARAMS = "ref=2:subme=6"
+# Best quality (no target size): single-pass CRF, capped at ENCODE_BITRATE
+ENCODE_CRF = 18
+# Two-pass libx264: pass 1 only gathers rate-control stats, so its downscale uses the cheapest swscale kernel.
+# The resolution must stay the same (x264 rejects a stats file made at another size).
+PASS1_SCALE_FLAGS = "fast_bilinear"
+# Single-pass fast path (short clips with a target size): ABR with VBV peak/buffer relative to -b:v instead of pass 1
+SINGLE_PASS_MAX_DURATION_SEC = 30.0
+SINGLE_PASS_MAXRATE_FACTOR = 1.2
+SINGLE_PASS_BUFSIZE_FACTOR = 2.0
 AUDIO_BITRATE = "160k"
 AUDIO_CHANNELS = 2
+# Source audio that already fits the output (AAC, mono/stereo, <= AUDIO_BITRATE) is stream-copied instead
+AUDIO_COPY_MAX_BPS = 160_000
+# Time-sharded libx264 (run(parallel_shards=N)): shorter shards aren't worth the extra process start-up and concat
+SHARD_MIN_DURATION_SEC = 30.0
+
+# Subprocess launch: CPython (3.8–3.12) only uses posix_spawn instead of fork+exec when close_fds is False
+# (our fds are non-inheritable anyway) and the executable has a directory part; fork of the large frozen app
+# is the slow part on macOS. Windows has no fork, keep its defaults.
+_SPAWN_KWARGS: dict = {} if sys.platform == "win32" else {"close_fds": False}
+
+# FFmpeg stderr shares the progress pipe (read continuously, so FFmpeg never blocks on it); keep only the tail for errors
+STDERR_TAIL_LINES = 4096
+
+# Default VAAPI device (first GPU render node); decode_hwaccel only picks vaapi when it exists
+VAAPI_RENDER_NODE = "/dev/dri/renderD128"
+
+# FFmpeg capability cache (hwaccels, NVENC/NVDEC, filters), keyed by the binary's path + mtime + size
+CAPS_CACHE_FILE = "ffmpeg_caps.json"
+CAPS_CACHE_VERSION = 1
+
+# -progress pipe:1 emits strict key=value lines in blocks, each terminated by progress=continue|end
+# (every -stats_period, 0.5 s by default); read in large chunks as bytes
+PROGRESS_READ_SIZE = 65536
+# Keys of those lines (plus stream_<file>_<stream>_q=); any other line on the pipe is FFmpeg's stderr
+_PROGRESS_KEYS = frozenset((
+    b"frame", b"fps", b"bitrate", b"total_size", b"out_time_us", b"out_time_ms", b"out_time",
+    b"dup_frames", b"drop_frames", b"speed", b"progress",
+))
+
+# GPU (NVIDIA) encode settings: decode, filter input and encode stay in VRAM where possible.
+# HEVC, not H.264: h264_nvenc is limited to 4096 px wide on every NVIDIA generation and the output is 4320 wide
+# (hevc_nvenc allows 8192 from Pascal on).
+NVENC_CODEC = "hevc_nvenc"
+NVENC_PRESET = "p5"
+NVENC_PROFILE = "main"
+NVENC_TUNE = "hq"
+NVENC_LOOKAHEAD = 32
+# Single-pass VBR: peak and VBV buffer relative to the target bitrate (keeps size close to target without pass 1)
+NVENC_MAXRATE_FACTOR = 1.5
+NVENC_BUFSIZE_FACTOR = 2.0
+# GPU "Best quality (10-bit HEVC)": constant-quality VBR, 10-bit 4:2:0
+NVENC_HEVC_CODEC = "hevc_nvenc"
+NVENC_HEVC_PRESET = "p6"
+NVENC_HEVC_PROFILE = "main10"
+NVENC_HEVC_CQ = 22
+# NVDEC frame size limits (width and height): H.264 stops at 4096, HEVC/VP9/AV1 at 8192 (Pascal and newer)
+NVDEC_MAX_H264_PX = 4096
+NVDEC_MAX_PX = 8192
+
+
+def audio_args(audio_copy: bool) -> list[str]:
+    """Output audio options: stream copy, or AAC at AUDIO_BITRATE / AUDIO_CHANNELS."""
+    if audio_copy:
+        return ["-c:a", "copy"]
+    return ["-c:a", "aac", "-b:a", AUDIO_BITRATE, "-ac", str(AUDIO_CHANNELS)]
 
 
 def video_bitrate_for_target_size_mb(target_size_mb: float, duration_sec: float) -> str:
@@ -52,17 +136,76 @@ def video_bitrate_for_target_size_mb(target_size_mb: float, duration_sec: float)
     return f"{video_kbps}k"
 
 
+def nvenc_rate_args(video_bitrate: str) -> list[str]:
+    """
+    Single-invocation NVENC VBR args for a bitrate like "5000k": -b:v plus -maxrate/-bufsize headroom,
+    full-resolution NVENC multipass, lookahead and spatial/temporal AQ (replaces the libx264 two-pass).
+    """
+    kbps = int(video_bitrate.rstrip("k"))
+    return [
+        "-tune", NVENC_TUNE,
+        "-rc", "vbr",
+        "-b:v", f"{kbps}k",
+        "-maxrate", f"{int(kbps * NVENC_MAXRATE_FACTOR)}k",
+        "-bufsize", f"{int(kbps * NVENC_BUFSIZE_FACTOR)}k",
+        "-multipass", "fullres",
+        "-rc-lookahead", str(NVENC_LOOKAHEAD),
+        "-spatial-aq", "1",
+        "-temporal-aq", "1",
+    ]
+
+
+def nvenc_hevc_10bit_args() -> list[str]:
+    """hevc_nvenc Main10 constant-quality args (-b:v 0 lets -cq alone drive the rate); tagged hvc1 for QuickTime."""
+    return [
+        "-c:v", NVENC_HEVC_CODEC,
+        "-preset", NVENC_HEVC_PRESET,
+        "-profile:v", NVENC_HEVC_PROFILE,
+        "-rc", "vbr",
+        "-cq", str(NVENC_HEVC_CQ),
+        "-b:v", "0",
+        "-rc-lookahead", str(NVENC_LOOKAHEAD),
+        "-spatial-aq", "1",
+        "-temporal-aq", "1",
+        "-tag:v", "hvc1",
+    ]
+
+
+def _cache_found(lookup: Callable[[], Optional[str]]) -> Callable[[], Optional[str]]:
+    """
+    Memoize a no-argument tool lookup only once it finds something: None is retried on the next call, so
+    installing FFmpeg while the app runs is picked up. The wrapper has cache_clear() like functools.cache.
+    """
+    found: list[str] = []
+
+    @functools.wraps(lookup)
+    def wrapper() -> Optional[str]:
+        if found:
+            return found[0]
+        result = lookup()
+        if result:
+            found.append(result)
+        return result
+
+    wrapper.cache_clear = found.clear
+    return wrapper
+
+
+@_cache_found
 def find_ffmpeg() -> Optional[str]:
-    """Return path to ffmpeg binary (PATH only), or None if not found."""
+    """Return path to ffmpeg binary (PATH only, resolved once found), or None if not found."""
     return shutil.which("ffmpeg")
 
 
+@_cache_found
 def get_ffmpeg_path() -> Optional[str]:
     """
-    Return path to ffmpeg for use by the app.
+    Return path to ffmpeg for use by the app (resolved once found; None is looked up again next call).
     When running as a PyInstaller bundle, looks in the bundle's bin/ first
     (.app Contents/Frameworks/bin or sys._MEIPASS/bin). Otherwise uses PATH (find_ffmpeg).
+    Set BEZEL_DEBUG=1 to log the bundled lookup to /tmp/bezel_ffmpeg_debug.txt and ~/Library/Logs.
     """
+    debug = bool(os.environ.get("BEZEL_DEBUG"))
     def _check_base(base: Path) -> Optional[str]:
         if not base.exists():
             return None
@@ -122,18 +265,19 @@ def get_ffmpeg_path() -> Optional[str]:
                 _debug_lines.append(f"  _MEIPASS base {base}: exists={base.exists()}, ffmpeg found={r is not None}")
                 if r:
                     return r
-        # Write debug to /tmp and to user Logs (so we can see lookup result)
-        for log_path in (Path("/tmp/bezel_ffmpeg_debug.txt"), Path.home() / "Library" / "Logs" / "Bezel Remover.log"):
-            try:
-                with open(log_path, "a", encoding="utf-8") as f:
-                    f.write("\n[FFmpeg lookup]\n")
-                    for line in _debug_lines:
-                        f.write(line + "\n")
-                    f.write("-> bundled lookup failed, using find_ffmpeg()\n")
-            except Exception:
-                pass
+        # Write debug to /tmp and to user Logs (so we can see lookup result); opt-in via BEZEL_DEBUG
+        if debug:
+            for log_path in (Path("/tmp/bezel_ffmpeg_debug.txt"), Path.home() / "Library" / "Logs" / "Bezel Remover.log"):
+                try:
+                    with open(log_path, "a", encoding="utf-8") as f:
+                        f.write("\n[FFmpeg lookup]\n")
+                        for line in _debug_lines:
+                            f.write(line + "\n")
+                        f.write("-> bundled lookup failed, using find_ffmpeg()\n")
+                except Exception:
+                    pass
     result = find_ffmpeg()
-    if getattr(sys, "frozen", False) and result:
+    if debug and getattr(sys, "frozen", False) and result:
         for log_path in (Path("/tmp/bezel_ffmpeg_debug.txt"), Path.home() / "Library" / "Logs" / "Bezel Remover.log"):
             try:
                 with open(log_path, "a", encoding="utf-8") as f:
@@ -143,11 +287,295 @@ def get_ffmpeg_path() -> Optional[str]:
     return result
 
 
+def _ffmpeg_list(ffmpeg: str, option: str, hide_banner: bool = True) -> Optional[subprocess.CompletedProcess]:
+    """Run `ffmpeg <option>` (e.g. -hwaccels); None if it cannot be run or fails."""
+    cmd = [ffmpeg, "-hide_banner", option] if hide_banner else [ffmpeg, option]
+    try:
+        out = subprocess.run(cmd, capture_output=True, text=True, timeout=10, **_SPAWN_KWARGS)
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out if out.returncode == 0 else None
+
+
+def _probe_ffmpeg_caps(ffmpeg: str) -> tuple[dict, bool]:
+    """
+    Probe FFmpeg capabilities: version, hwaccels, NVENC encoders, NVDEC codecs and filters, plus whether every
+    probe ran (False if any failed or timed out, so some lists may be wrongly empty).
+    FFmpeg exits after the first info option, so each list is its own run; the version comes from the
+    -hwaccels banner instead of a separate -version run.
+    """
+    complete = True
+    version = ""
+    hwaccels = []
+    out = _ffmpeg_list(ffmpeg, "-hwaccels", hide_banner=False)
+    complete &= out is not None
+    if out:
+        for line in out.stderr.splitlines():
+            if line.startswith("ffmpeg version "):
+                version = line.split()[2]
+                break
+        for line in out.stdout.splitlines():
+            line = line.strip()
+            if line and not line.endswith(":"):
+                hwaccels.append(line)
+
+    # Encoder/decoder rows look like " V....D h264_nvenc  NVIDIA NVENC H.264 encoder"
+    nvenc_encoders = []
+    out = _ffmpeg_list(ffmpeg, "-encoders")
+    complete &= out is not None
+    if out:
+        for line in out.stdout.splitlines():
+            parts = line.split()
+            if len(parts) >= 2 and parts[1].endswith("_nvenc"):
+                nvenc_encoders.append(parts[1])
+
+    nvdec_codecs = []
+    out = _ffmpeg_list(ffmpeg, "-decoders")
+    complete &= out is not None
+    if out:
+        for line in out.stdout.splitlines():
+            parts = line.split()
+            if len(parts) >= 2 and parts[1].endswith("_cuvid"):
+                nvdec_codecs.append(parts[1][: -len("_cuvid")])
+
+    # Filter rows look like " ... scale_cuda        V->V       GPU accelerated video resizer"
+    filters = []
+    out = _ffmpeg_list(ffmpeg, "-filters")
+    complete &= out is not None
+    if out:
+        for line in out.stdout.splitlines():
+            parts = line.split()
+            if len(parts) >= 3 and "->" in parts[2]:
+                filters.append(parts[1])
+
+    return {
+        "version": version,
+        "hwaccels": sorted(hwaccels),
+        "nvenc_encoders": sorted(nvenc_encoders),
+        "nvdec_codecs": sorted(nvdec_codecs),
+        "filters": sorted(filters),
+    }, complete
+
+
+def _caps_cache_path() -> Path:
+    """Per-user cache file for FFmpeg capabilities (survives app launches)."""
+    if sys.platform == "darwin":
+        base = Path.home() / "Library" / "Caches"
+    elif sys.platform == "win32":
+        base = Path(os.environ.get("LOCALAPPDATA") or Path.home() / "AppData" / "Local")
+    else:
+        base = Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache")
+    return base / "BezelRemover" / CAPS_CACHE_FILE
+
+
+def _caps_cache_key(ffmpeg: str) -> Optional[dict]:
+    """Identify an FFmpeg binary by path, mtime and size (a replaced/upgraded binary invalidates the cache)."""
+    try:
+        st = os.stat(ffmpeg)
+    except OSError:
+        return None
+    return {"ffmpeg": str(Path(ffmpeg).resolve()), "mtime_ns": st.st_mtime_ns, "size": st.st_size}
+
+
+def _load_caps_cache(ffmpeg: str) -> Optional[dict]:
+    """Cached capabilities for this exact ffmpeg binary, or None on miss."""
+    key = _caps_cache_key(ffmpeg)
+    if key is None:
+        return None
+    try:
+        with open(_caps_cache_path(), encoding="utf-8") as f:
+            data = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if data.get("cache_version") != CAPS_CACHE_VERSION or data.get("key") != key:
+        return None
+    return data.get("caps")
+
+
+def _save_caps_cache(ffmpeg: str, caps: dict) -> None:
+    """Write the cache atomically (temp file + rename) so a crash never leaves a half-written file."""
+    key = _caps_cache_key(ffmpeg)
+    if key is None:
+        return
+    path = _caps_cache_path()
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", encoding="utf-8", dir=path.parent, suffix=".tmp", delete=False) as f:
+            json.dump({"cache_version": CAPS_CACHE_VERSION, "key": key, "caps": caps}, f)
+        os.replace(f.name, path)
+    except OSError:
+        pass
+
+
+_caps_memo: dict[str, dict] = {}
+_caps_lock = threading.Lock()
+
+
+def get_ffmpeg_caps(ffmpeg: str) -> dict:
+    """
+    FFmpeg capabilities (see _probe_ffmpeg_caps), probed once per binary: memoized in-process and
+    persisted across launches, so a cache hit starts no FFmpeg process at all. A probe where any run failed
+    or timed out is returned but neither memoized nor persisted, so the next call probes again.
+    """
+    with _caps_lock:
+        caps = _caps_memo.get(ffmpeg)
+        if caps is None:
+            caps = _load_caps_cache(ffmpeg)
+            if caps is None:
+                caps, complete = _probe_ffmpeg_caps(ffmpeg)
+                if not complete:
+                    return caps
+                _save_caps_cache(ffmpeg, caps)
+            _caps_memo[ffmpeg] = caps
+    return caps
+
+
+def get_ffmpeg_hwaccels(ffmpeg: str) -> set[str]:
+    """Return hardware acceleration methods listed by `ffmpeg -hwaccels` (e.g. {"cuda", "videotoolbox"})."""
+    return set(get_ffmpeg_caps(ffmpeg)["hwaccels"])
+
+
+def get_ffmpeg_filters(ffmpeg: str) -> set[str]:
+    """Return filter names listed by `ffmpeg -filters` (e.g. to check for scale_cuda)."""
+    return set(get_ffmpeg_caps(ffmpeg)["filters"])
+
+
+def get_nvenc_encoders(ffmpeg: str) -> set[str]:
+    """Return NVIDIA encoders in this FFmpeg build (e.g. {"h264_nvenc", "hevc_nvenc"})."""
+    return set(get_ffmpeg_caps(ffmpeg)["nvenc_encoders"])
+
+
+def get_nvdec_codecs(ffmpeg: str) -> set[str]:
+    """
+    Return input codecs this FFmpeg build can decode on NVIDIA hardware, from its *_cuvid decoders
+    (e.g. {"h264", "hevc", "av1"}). Reflects the build, not the card: older GPUs may still lack e.g. AV1.
+    """
+    return set(get_ffmpeg_caps(ffmpeg)["nvdec_codecs"])
+
+
+def nvdec_can_decode(codec: Optional[str], size: Optional[tuple[int, int]], nvdec_codecs: set[str]) -> bool:
+    """
+    True if NVDEC should handle this input: the codec is in nvdec_codecs (see get_nvdec_codecs) and the frame fits
+    NVDEC's size limit (NVDEC_MAX_H264_PX for H.264, so the usual 8640×3840 H.264 composite is CPU-decoded).
+    With -hwaccel_output_format cuda there is no software fallback, so anything doubtful returns False.
+    """
+    if not codec or codec not in nvdec_codecs:
+        return False
+    limit = NVDEC_MAX_H264_PX if codec == "h264" else NVDEC_MAX_PX
+    return not size or max(size) <= limit
+
+
+def gpu_available(ffmpeg: str) -> bool:
+    """True if this FFmpeg build can decode with CUDA (required for the NVIDIA GPU path)."""
+    return "cuda" in get_ffmpeg_hwaccels(ffmpeg)
+
+
+def decode_hwaccel(ffmpeg: str, codec: Optional[str], size: Optional[tuple[int, int]]) -> Optional[str]:
+    """
+    Hardware decoder for the libx264 path (opt-in, see run(hwaccel_decode=...)): videotoolbox on macOS, cuda when
+    nvdec_can_decode() accepts the input, vaapi on Linux with a render node; None = software decode.
+    Frames are downloaded to system memory for the CPU filter graph. This only checks the build and the input:
+    a listed hwaccel can still fail at device setup (e.g. no driver), so callers retry in software
+    (_retry_in_software).
+    """
+    hwaccels = get_ffmpeg_hwaccels(ffmpeg)
+    if sys.platform == "darwin" and "videotoolbox" in hwaccels:
+        return "videotoolbox"
+    if "cuda" in hwaccels and nvdec_can_decode(codec, size, get_nvdec_codecs(ffmpeg)):
+        return "cuda"
+    if sys.platform.startswith("linux") and "vaapi" in hwaccels and os.path.exists(VAAPI_RENDER_NODE):
+        return "vaapi"
+    return None
+
+
+@functools.lru_cache(maxsize=4)
+def nvenc_usable(ffmpeg: str) -> bool:
+    """
+    True if NVENC_CODEC can actually open a session at the output size: one black frame encoded to the null muxer.
+    Catches full builds (e.g. gyan.dev) on machines without an NVIDIA GPU/driver, which the build lists alone don't.
+    Checked once per process (the GPU can change between launches, so it is not part of the capability cache).
+    """
+    if not (gpu_available(ffmpeg) and NVENC_CODEC in get_nvenc_encoders(ffmpeg)):
+        return False
+    cmd = [
+        ffmpeg,
+        "-hide_banner",
+        "-loglevel", "error",
+        "-f", "lavfi",
+        "-i", f"color=black:s={OUTPUT_WIDTH}x{OUTPUT_HEIGHT}:d=0.1",
+        "-frames:v", "1",
+        "-c:v", NVENC_CODEC,
+        "-f", "null",
+        "-",
+    ]
+    try:
+        return subprocess.run(cmd, capture_output=True, timeout=30, **_SPAWN_KWARGS).returncode == 0
+    except (OSError, subprocess.SubprocessError):
+        return False
+
+
+def resolve_encoder(encoder: str, ffmpeg: str) -> str:
+    """Map run()'s encoder choice to "nvenc" or "libx264"; "auto" picks NVENC only when nvenc_usable() passes."""
+    if encoder == "auto":
+        return "nvenc" if nvenc_usable(ffmpeg) else "libx264"
+    if encoder not in ("nvenc", "libx264"):
+        raise ValueError(f'encoder must be "auto", "nvenc" or "libx264", not {encoder!r}')
+    return encoder
+
+
+@_cache_found
 def find_ffprobe() -> Optional[str]:
-    """Return path to ffprobe binary, or None if not found."""
+    """Return path to ffprobe binary (PATH only, resolved once found), or None if not found."""
     return shutil.which("ffprobe")
 
 
+def ffprobe_beside(ffmpeg_path: Optional[str]) -> Optional[str]:
+    """
+    ffprobe next to an explicit ffmpeg (bundled builds ship both in the same bin/), if that file exists;
+    None → helpers use PATH.
+    """
+    if not ffmpeg_path:
+        return None
+    ffprobe_name = "ffprobe.exe" if sys.platform == "win32" else "ffprobe"
+    ffprobe = Path(ffmpeg_path).parent / ffprobe_name
+    return str(ffprobe) if os.path.isfile(ffprobe) else None
+
+
+@dataclass(frozen=True, slots=True)
+class FfmpegTools:
+    """Resolved FFmpeg binaries for one job; ffprobe None → no probing (size/duration unknown)."""
+    ffmpeg: str
+    ffprobe: Optional[str]
+
+
+_tools_memo: dict[Optional[str], FfmpegTools] = {}
+
+
+def resolve_tools(explicit_ffmpeg: Optional[str] = None) -> FfmpegTools:
+    """
+    Resolve ffmpeg and ffprobe once per explicit path: an explicit ffmpeg uses the ffprobe beside it when that
+    exists, otherwise ffprobe from PATH; no explicit ffmpeg → get_ffmpeg_path(). Raises RuntimeError when FFmpeg
+    is missing. Only complete results are memoized: a missing ffprobe is looked up again next call.
+    """
+    tools = _tools_memo.get(explicit_ffmpeg)
+    if tools is not None:
+        return tools
+    ffmpeg = explicit_ffmpeg or get_ffmpeg_path()
+    if not ffmpeg:
+        raise RuntimeError("FFmpeg not found. Please install FFmpeg and add it to your PATH.")
+    tools = FfmpegTools(ffmpeg, ffprobe_beside(explicit_ffmpeg) or find_ffprobe())
+    if tools.ffprobe:
+        _tools_memo[explicit_ffmpeg] = tools
+    return tools
+
+
+def reset_tool_cache() -> None:
+    """Forget every memoized ffmpeg/ffprobe lookup (e.g. after installing FFmpeg or changing PATH)."""
+    for lookup in (find_ffmpeg, find_ffprobe, get_ffmpeg_path):
+        lookup.cache_clear()
+    _tools_memo.clear()
+
+
 def get_duration_seconds(input_path: Union[str, Path], ffprobe_path: Optional[str] = None) -> Optional[float]:
     """Get video duration in seconds via ffprobe. Returns None if unavailable."""
     ffprobe = ffprobe_path or find_ffprobe()
@@ -161,7 +589,7 @@ def get_duration_seconds(input_path: Union[str, Path], ffprobe_path: Optional[st
         str(input_path),
     ]
     try:
-        out = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
+        out = subprocess.run(cmd, capture_output=True, text=True, timeout=10, **_SPAWN_KWARGS)
         if out.returncode == 0 and out.stdout.strip():
             return float(out.stdout.strip())
     except (subprocess.SubprocessError, ValueError):
@@ -169,92 +597,277 @@ def get_duration_seconds(input_path: Union[str, Path], ffprobe_path: Optional[st
     return None
 
 
-def get_video_size(input_path: Union[str, Path], ffprobe_path: Optional[str] = None) -> Optional[tuple[int, int]]:
-    """Get (width, height) of first video stream via ffprobe. Returns None if unavailable."""
+def get_video_info(
+    input_path: Union[str, Path], ffprobe_path: Optional[str] = None
+) -> tuple[Optional[tuple[int, int]], Optional[float], Optional[str], bool]:
+    """
+    Get ((width, height) of first video stream, duration in seconds, its codec name, audio_copy) with a single
+    ffprobe run. audio_copy is True when the first audio stream can be stream-copied (AAC, 1–2 channels, known
+    bit rate <= AUDIO_COPY_MAX_BPS). Size/duration/codec are None and audio_copy False if unavailable.
+    """
     ffprobe = ffprobe_path or find_ffprobe()
     if not ffprobe:
-        return None
+        return None, None, None, False
     cmd = [
         ffprobe,
         "-v", "error",
-        "-select_streams", "v:0",
-        "-show_entries", "stream=width,height",
-        "-of", "csv=p=0",
+        "-show_entries", "stream=index,codec_type,codec_name,width,height,channels,bit_rate:format=duration",
+        "-of", "default=noprint_wrappers=1",
         str(input_path),
     ]
     try:
-        out = subprocess.run(cmd, capture_output=True, text=True, timeout=10)
-        if out.returncode == 0 and out.stdout.strip():
-            parts = out.stdout.strip().split(",")
-            if len(parts) >= 2:
-                return (int(parts[0]), int(parts[1]))
-    except (subprocess.SubprocessError, ValueError):
+        out = subprocess.run(cmd, capture_output=True, text=True, timeout=10, **_SPAWN_KWARGS)
+    except (OSError, subprocess.SubprocessError):
+        return None, None, None, False
+    if out.returncode != 0:
+        return None, None, None, False
+    # Streams print in order, each starting with index=; format duration comes last
+    streams: list[dict[str, str]] = []
+    values: dict[str, str] = {}
+    for line in out.stdout.splitlines():
+        key, sep, value = line.partition("=")
+        if not sep:
+            continue
+        key = key.strip()
+        if key == "index":
+            values = {}
+            streams.append(values)
+        values[key] = value.strip()
+    video = next((st for st in streams if st.get("codec_type") == "video"), {})
+    audio = next((st for st in streams if st.get("codec_type") == "audio"), {})
+    size = None
+    duration = None
+    try:
+        size = (int(video["width"]), int(video["height"]))
+    except (KeyError, ValueError):
+        pass
+    try:
+        duration = float(values["duration"])
+    except (KeyError, ValueError):
+        pass
+    audio_copy = (
+        audio.get("codec_name") == "aac"
+        and audio.get("channels") in ("1", "2")
+        and audio.get("bit_rate", "").isdigit()
+        and int(audio["bit_rate"]) <= AUDIO_COPY_MAX_BPS
+    )
+    return size, duration, video.get("codec_name"), audio_copy
+
+
+def _iter_mp4_boxes(f, start: int, end: int):
+    """Yield (type, payload start, payload end) for the ISO-BMFF boxes between start and end of open file f."""
+    pos = start
+    while pos + 8 <= end:
+        f.seek(pos)
+        header = f.read(16)
+        if len(header) < 8:
+            return
+        size, box_type = struct.unpack(">I4s", header[:8])
+        header_len = 8
+        if size == 1:
+            # 64-bit largesize follows the type
+            if len(header) < 16:
+                return
+            size = struct.unpack(">Q", header[8:16])[0]
+            header_len = 16
+        elif size == 0:
+            size = end - pos
+        if size < header_len or pos + size > end:
+            return
+        yield box_type, pos + header_len, pos + size
+        pos += size
+
+
+# MP4/MOV sample entry fourcc → FFmpeg codec name (what ffprobe reports as codec_name)
+_MP4_CODECS = {
+    b"avc1": "h264", b"avc3": "h264",
+    b"hvc1": "hevc", b"hev1": "hevc",
+    b"av01": "av1",
+    b"vp09": "vp9",
+    b"mp4v": "mpeg4",
+    b"apch": "prores", b"apcn": "prores", b"apcs": "prores", b"apco": "prores", b"ap4h": "prores",
+}
+
+
+def _probe_mp4_video(input_path: Union[str, Path]) -> Optional[tuple[tuple[int, int], Optional[str]]]:
+    """
+    ((width, height), codec name) of the first video track of an MP4/MOV from its moov/trak boxes: tkhd for the
+    size (16.16 fixed point), the first stsd sample entry for the codec (None if not in _MP4_CODECS). Reads only box
+    headers and a few hundred bytes; None for other containers or anything unexpected.
+    """
+    try:
+        with open(input_path, "rb") as f:
+            end = f.seek(0, os.SEEK_END)
+            # Top level: skip ftyp/mdat/free by size until moov (often after a multi-GB mdat)
+            moov = next(((s, e) for t, s, e in _iter_mp4_boxes(f, 0, end) if t == b"moov"), None)
+            if not moov:
+                return None
+            for box_type, trak_start, trak_end in _iter_mp4_boxes(f, *moov):
+                if box_type != b"trak":
+                    continue
+                size = None
+                handler = None
+                fourcc = None
+                for child, start, child_end in _iter_mp4_boxes(f, trak_start, trak_end):
+                    if child == b"tkhd":
+                        f.seek(start)
+                        tkhd = f.read(child_end - start)
+                        # width/height follow times, ids, layer/volume and the 3×3 matrix; version 1 has 64-bit times
+                        offset = 88 if tkhd[:1] == b"\x01" else 76
+                        if len(tkhd) >= offset + 8:
+                            w, h = struct.unpack(">II", tkhd[offset:offset + 8])
+                            size = (w >> 16, h >> 16)
+                    elif child == b"mdia":
+                        for sub, sub_start, sub_end in _iter_mp4_boxes(f, start, child_end):
+                            if sub == b"hdlr":
+                                # version/flags (4) + pre_defined (4), then the handler type
+                                f.seek(sub_start + 8)
+                                handler = f.read(4)
+                            elif sub == b"minf":
+                                stbl = next(
+                                    ((s, e) for t, s, e in _iter_mp4_boxes(f, sub_start, sub_end) if t == b"stbl"),
+                                    None,
+                                )
+                                stsd = stbl and next(
+                                    (s for t, s, _ in _iter_mp4_boxes(f, *stbl) if t == b"stsd"), None
+                                )
+                                if stsd is not None:
+                                    # version/flags (4) + entry_count (4), then the first entry's size and type
+                                    f.seek(stsd + 12)
+                                    fourcc = f.read(4)
+                if handler == b"vide" and size and size[0] > 0 and size[1] > 0:
+                    return size, _MP4_CODECS.get(fourcc)
+    except (OSError, struct.error):
         pass
     return None
 
 
-def build_filter_horizontal(top_bezel_px: int, bottom_bezel_px: int) -> str:
+def get_video_size_codec(
+    input_path: Union[str, Path], ffprobe_path: Optional[str] = None
+) -> tuple[Optional[tuple[int, int]], Optional[str]]:
+    """
+    Get ((width, height), codec name) of the first video stream: parsed from the MP4/MOV header when it has both
+    (no subprocess), otherwise via get_video_info's ffprobe run. Either is None if unavailable.
+    """
+    probed = _probe_mp4_video(input_path)
+    if probed and probed[1]:
+        return probed
+    size, _, codec, _ = get_video_info(input_path, ffprobe_path=ffprobe_path)
+    return size, codec
+
+
+def get_video_size(input_path: Union[str, Path], ffprobe_path: Optional[str] = None) -> Optional[tuple[int, int]]:
+    """Get (width, height) of first video stream (see get_video_size_codec). Returns None if unavailable."""
+    return get_video_size_codec(input_path, ffprobe_path=ffprobe_path)[0]
+
+
+def _filter_sources(hw_download: bool) -> tuple[list[str], list[str]]:
+    """
+    Return (head filter parts, 4 input labels) for the per-panel crops.
+    Software frames: [0:v] can be referenced 4 times directly.
+    CUDA frames (-hwaccel_output_format cuda): download once, then split into 4 labelled copies.
+    """
+    if not hw_download:
+        return [], ["[0:v]"] * PANEL_COUNT
+    labels = [f"[s{i}]" for i in range(1, PANEL_COUNT + 1)]
+    return [f"[0:v]hwdownload,format=nv12|p010le,split={PANEL_COUNT}{''.join(labels)}"], labels
+
+
+def _filter_output(
+    hw_upload: bool, cuda_scale: bool = False, hw_format: str = "nv12", scale_flags: str = "lanczos"
+) -> str:
+    """
+    Final scale node ([v0] → [v]); uploads to CUDA for NVENC when hw_upload is set.
+    cuda_scale: upload the stacked frame and run the downscale on the GPU (scale_cuda, default interpolation:
+    interp_algo only parses on newer builds) instead of in swscale, the heaviest per-frame CPU step on the GPU path.
+    hw_format: uploaded pixel format (nv12 for 8-bit, p010le for 10-bit HEVC).
+    scale_flags: swscale kernel for the CPU downscale.
+    """
+    if hw_upload and cuda_scale:
+        return f"[v0]format={hw_format},hwupload_cuda,scale_cuda={OUTPUT_WIDTH}:{OUTPUT_HEIGHT}[v]"
+    if hw_upload:
+        return f"[v0]scale={OUTPUT_WIDTH}:{OUTPUT_HEIGHT}:flags={scale_flags},format={hw_format},hwupload_cuda[v]"
+    return f"[v0]scale={OUTPUT_WIDTH}:{OUTPUT_HEIGHT}:flags={scale_flags}[v]"
+
+
+def build_filter_horizontal(
+    top_bezel_px: int,
+    bottom_bezel_px: int,
+    hw_download: bool = False,
+    hw_upload: bool = False,
+    cuda_scale: bool = False,
+    hw_format: str = "nv12",
+    scale_flags: str = "lanczos",
+) -> str:
     """
     Input is horizontal composite: 8640×3840 (4 panels side-by-side).
     Split into 4 vertical strips (each 2160×3840), crop bezel from left/right of each, hstack.
     Mapping: leftmost strip → Display 1, next → Display 2, next → Display 3, rightmost → Display 4
     (one continuous stream left-to-right across the row). Portrait: top bezel = left edge of strip,
     bottom bezel = right edge.
+    hw_download / hw_upload: frames arrive as / leave as CUDA surfaces (GPU path); cuda_scale: scale on the GPU;
+    hw_format: pixel format of the uploaded frames; scale_flags: swscale kernel (PASS1_SCALE_FLAGS for pass 1).
     """
-    strip_w_expr = "iw/4"
-    crop_h_expr = "ih"
-    x_off = top_bezel_px
-    # First crop: take 1/4-width strips from source [0:v] (iw/4 × ih).
-    # Second crop: remove bezel from each strip; input is [a1] so its width is already the strip width → use iw - top - bottom
-    strip_bezel_w = f"iw-{top_bezel_px}-{bottom_bezel_px}"
-    parts = [
-        f"[0:v]crop={strip_w_expr}:{crop_h_expr}:0:0[a1]",
-        f"[0:v]crop={strip_w_expr}:{crop_h_expr}:iw/4:0[a2]",
-        f"[0:v]crop={strip_w_expr}:{crop_h_expr}:iw/2:0[a3]",
-        f"[0:v]crop={strip_w_expr}:{crop_h_expr}:3*iw/4:0[a4]",
-        f"[a1]crop={strip_bezel_w}:{crop_h_expr}:{x_off}:0[b1]",
-        f"[a2]crop={strip_bezel_w}:{crop_h_expr}:{x_off}:0[b2]",
-        f"[a3]crop={strip_bezel_w}:{crop_h_expr}:{x_off}:0[b3]",
-        f"[a4]crop={strip_bezel_w}:{crop_h_expr}:{x_off}:0[b4]",
+    head, src = _filter_sources(hw_download)
+    # One crop per panel straight from the source: strip k starts at k*iw/4, bezel-free part at +top_bezel_px
+    # (crop only offsets data pointers, so no intermediate full-strip frames are made).
+    crop_w_expr = f"iw/4-{top_bezel_px}-{bottom_bezel_px}"
+    parts = head + [
+        f"{src[k]}crop={crop_w_expr}:ih:{k}*iw/4+{top_bezel_px}:0[b{k + 1}]" for k in range(PANEL_COUNT)
+    ] + [
         "[b1][b2][b3][b4]hstack=inputs=4[v0]",
-        f"[v0]scale={OUTPUT_WIDTH}:{OUTPUT_HEIGHT}:flags=lanczos[v]",
+        _filter_output(hw_upload, cuda_scale, hw_format, scale_flags),
     ]
     return ";".join(parts)
 
 
-def build_filter_vertical(top_bezel_px: int, bottom_bezel_px: int) -> str:
+def build_filter_vertical(
+    top_bezel_px: int,
+    bottom_bezel_px: int,
+    hw_download: bool = False,
+    hw_upload: bool = False,
+    cuda_scale: bool = False,
+    hw_format: str = "nv12",
+    scale_flags: str = "lanczos",
+) -> str:
     """
     Input is vertical stack: 3840×8640 (4 panels as horizontal bands top-to-bottom).
     Each band is 3840×2160 (landscape). Rotate each 90° CCW → 2160×3840 (portrait),
     crop bezel from left/right of each, hstack.
     Portrait: top bezel = left edge of strip, bottom bezel = right edge.
+    hw_download / hw_upload: frames arrive as / leave as CUDA surfaces (GPU path); cuda_scale: scale on the GPU;
+    hw_format: pixel format of the uploaded frames; scale_flags: swscale kernel (PASS1_SCALE_FLAGS for pass 1).
     """
-    # Band size: full width iw, height ih/4
-    band_w_expr = "iw"
-    band_h_expr = "ih/4"
-    # After transpose=2 (90° CCW), frame is 2160×3840; crop left/right bezel
-    crop_w_expr = f"iw-{top_bezel_px}-{bottom_bezel_px}"
-    crop_h_expr = "ih"
-    x_off = top_bezel_px
-    parts = [
-        f"[0:v]crop={band_w_expr}:{band_h_expr}:0:0[a1]",
-        f"[0:v]crop={band_w_expr}:{band_h_expr}:0:ih/4[a2]",
-        f"[0:v]crop={band_w_expr}:{band_h_expr}:0:ih/2[a3]",
-        f"[0:v]crop={band_w_expr}:{band_h_expr}:0:3*ih/4[a4]",
-        "[a1]transpose=2[a1r]",  # 90° CCW: 3840×2160 → 2160×3840
-        "[a2]transpose=2[a2r]",
-        "[a3]transpose=2[a3r]",
-        "[a4]transpose=2[a4r]",
-        f"[a1r]crop={crop_w_expr}:{crop_h_expr}:{x_off}:0[b1]",
-        f"[a2r]crop={crop_w_expr}:{crop_h_expr}:{x_off}:0[b2]",
-        f"[a3r]crop={crop_w_expr}:{crop_h_expr}:{x_off}:0[b3]",
-        f"[a4r]crop={crop_w_expr}:{crop_h_expr}:{x_off}:0[b4]",
+    head, src = _filter_sources(hw_download)
+    # transpose=2 (90° CCW) maps band row y to output column x, so the left/right bezel of the rotated panel
+    # is the top/bottom of the band: crop it before rotating (one crop + one transpose per panel).
+    crop_h_expr = f"ih/4-{top_bezel_px}-{bottom_bezel_px}"
+    parts = head + [
+        f"{src[k]}crop=iw:{crop_h_expr}:0:{k}*ih/4+{top_bezel_px},transpose=2[b{k + 1}]" for k in range(PANEL_COUNT)
+    ] + [
         "[b1][b2][b3][b4]hstack=inputs=4[v0]",
-        f"[v0]scale={OUTPUT_WIDTH}:{OUTPUT_HEIGHT}:flags=lanczos[v]",
+        _filter_output(hw_upload, cuda_scale, hw_format, scale_flags),
     ]
     return ";".join(parts)
 
 
+def build_filter_panel(
+    panel_index: int, top_bezel_px: int, bottom_bezel_px: int, vertical: bool, scale_flags: str = "lanczos"
+) -> str:
+    """
+    Single-panel graph for run_panels: take strip/band panel_index (0 = leftmost/top), rotate it 90° CCW
+    if vertical, crop its bezels and scale to PANEL_OUTPUT_WIDTH×OUTPUT_HEIGHT with scale_flags.
+    """
+    # Same single-crop mapping as build_filter_horizontal / build_filter_vertical
+    if vertical:
+        source = (
+            f"[0:v]crop=iw:ih/4-{top_bezel_px}-{bottom_bezel_px}:0:{panel_index}*ih/4+{top_bezel_px},transpose=2"
+        )
+    else:
+        source = f"[0:v]crop=iw/4-{top_bezel_px}-{bottom_bezel_px}:ih:{panel_index}*iw/4+{top_bezel_px}:0"
+    return f"{source},scale={PANEL_OUTPUT_WIDTH}:{OUTPUT_HEIGHT}:flags={scale_flags}[v]"
+
+
 def output_path(input_path: Union[str, Path], output_dir: Optional[Union[str, Path]] = None) -> Path:
     """Suggested output path: same dir as input, suffix _bezel_removed."""
     p = Path(input_path).resolve()
@@ -264,6 +877,11 @@ def output_path(input_path: Union[str, Path], output_dir: Optional[Union[str, Pa
     return parent / f"{stem}_bezel_removed{suffix}"
 
 
+def output_panel_path(out: Path, panel_index: int) -> Path:
+    """Per-panel output next to out: <stem>_panel1.mp4 … _panel4.mp4 (Display 1 = leftmost)."""
+    return out.parent / f"{out.stem}_panel{panel_index + 1}{out.suffix}"
+
+
 def _run_ffmpeg_pass(
     ffmpeg: str,
     input_path: Path,
@@ -276,81 +894,417 @@ def _run_ffmpeg_pass(
     pass_offset: float = 0.0,
     passlogfile_prefix: Optional[str] = None,
     video_bitrate: Optional[str] = None,
+    use_gpu: bool = False,
+    hw_decode: bool = False,
+    output_size: tuple[int, int] = (OUTPUT_WIDTH, OUTPUT_HEIGHT),
+    hevc_10bit: bool = False,
+    threads: Optional[int] = None,
+    hwaccel: Optional[str] = None,
+    shard: Optional[tuple[float, float]] = None,
+    audio_copy: bool = False,
 ) -> None:
-    """Run one FFmpeg pass (1 or 2). video_bitrate overrides ENCODE_BITRATE when set (e.g. from target file size)."""
+    """
+    Run one FFmpeg pass (1 or 2), or a single-pass encode (pass_num=0: NVENC, libx264 CRF and the short-clip path).
+    Decode, the whole crop/transpose/hstack/scale graph (one -filter_complex) and the encode run in this single
+    FFmpeg process; pass 1 goes to the null muxer. Keep it that way: no ffmpeg | ffmpeg pipes or intermediate
+    files, each of which would move every full-size raw frame through memory again.
+    duration_sec: input duration from get_video_info's ffprobe run; -progress has no duration key, so without it
+    progress_callback is not called.
+    video_bitrate overrides ENCODE_BITRATE when set (e.g. from target file size); single-pass libx264 without it is CRF.
+    use_gpu: hevc_nvenc encode (NVENC_CODEC); filter_complex must output CUDA frames (hw_upload).
+    hw_decode: CUDA decode (-hwaccel before -i); filter_complex must accept CUDA frames (hw_download).
+    hevc_10bit: with use_gpu, encode 10-bit HEVC at constant quality (video_bitrate is ignored).
+    threads: libx264 thread count (parallel jobs use this so they don't oversubscribe the CPU); None = x264 default.
+    hwaccel: hardware decoder for software frames (see decode_hwaccel), ignored with hw_decode; FFmpeg downloads the
+    decoded frames itself. A device that fails to open makes FFmpeg exit with an error (no automatic fallback).
+    shard: (start, length) in seconds: encode only that span (input seek) as video-only MPEG-TS, see _encode_x264_sharded.
+    audio_copy: stream-copy the source audio instead of re-encoding it (see get_video_info); pass 1 never has audio.
+    """
     b_v = video_bitrate if video_bitrate else ENCODE_BITRATE
+    if hw_decode:
+        input_args = ["-hwaccel", "cuda", "-hwaccel_output_format", "cuda"]
+    elif hwaccel:
+        input_args = ["-hwaccel", hwaccel]
+    else:
+        input_args = []
+    if shard:
+        input_args.extend(["-ss", f"{shard[0]:.3f}", "-t", f"{shard[1]:.3f}"])
+    if use_gpu and hevc_10bit:
+        # No -s / -pix_fmt: the filter graph already outputs OUTPUT_WIDTH×OUTPUT_HEIGHT p010le CUDA frames
+        video_args = nvenc_hevc_10bit_args()
+    elif use_gpu:
+        # No -s / -pix_fmt: the filter graph already outputs OUTPUT_WIDTH×OUTPUT_HEIGHT nv12 CUDA frames
+        video_args = [
+            "-c:v", NVENC_CODEC,
+            "-preset", NVENC_PRESET,
+            "-profile:v", NVENC_PROFILE,
+            *nvenc_rate_args(b_v),
+            "-tag:v", "hvc1",
+        ]
+    else:
+        video_args = [
+            "-s", f"{output_size[0]}x{output_size[1]}",
+            "-c:v", "libx264",
+            "-pix_fmt", ENCODE_PIX_FMT,
+            "-preset", ENCODE_PRESET,
+            "-profile:v", ENCODE_PROFILE,
+            "-level", ENCODE_LEVEL,
+            "-tune", ENCODE_TUNE,
+            "-x264-params", ENCODE_X264_PARAMS,
+        ]
+        if threads:
+            video_args.extend(["-threads", str(threads)])
+        if pass_num == 0 and video_bitrate is None:
+            # No target: constant quality, capped at the default bitrate
+            kbps = int(ENCODE_BITRATE.rstrip("k"))
+            video_args.extend(["-crf", str(ENCODE_CRF), "-maxrate", ENCODE_BITRATE, "-bufsize", f"{2 * kbps}k"])
+        elif pass_num == 0:
+            kbps = int(b_v.rstrip("k"))
+            video_args.extend([
+                "-b:v", b_v,
+                "-maxrate", f"{int(kbps * SINGLE_PASS_MAXRATE_FACTOR)}k",
+                "-bufsize", f"{int(kbps * SINGLE_PASS_BUFSIZE_FACTOR)}k",
+            ])
+        else:
+            video_args.extend(["-b:v", b_v])
     common = [
         ffmpeg,
         "-y",
+        *input_args,
         "-i", str(input_path),
         "-filter_complex", filter_complex,
         "-map", "[v]",
-        "-s", f"{OUTPUT_WIDTH}x{OUTPUT_HEIGHT}",
-        "-c:v", "libx264",
-        "-pix_fmt", ENCODE_PIX_FMT,
-        "-preset", ENCODE_PRESET,
-        "-profile:v", ENCODE_PROFILE,
-        "-level", ENCODE_LEVEL,
-        "-tune", ENCODE_TUNE,
-        "-b:v", b_v,
-        "-pass", str(pass_num),
+        *video_args,
+    ]
+    if pass_num:
+        common.extend(["-pass", str(pass_num)])
+    common.extend([
         "-progress", "pipe:1",
         "-nostats",
         "-hide_banner",
         "-loglevel", "error",
-    ]
-    if passlogfile_prefix is not None:
+    ])
+    if pass_num and passlogfile_prefix is not None:
         common.extend(["-passlogfile", passlogfile_prefix])
     if pass_num == 1:
         cmd = common + ["-an", "-f", "null", "-"]
+    elif shard:
+        # Audio is muxed once from the source when the shards are joined (AAC priming would click at every seam)
+        cmd = common + ["-an", "-f", "mpegts", str(out_path)]
     else:
         cmd = common + [
             "-map", "0:a?",
-            "-c:a", "aac",
-            "-b:a", AUDIO_BITRATE,
-            "-ac", str(AUDIO_CHANNELS),
+            *audio_args(audio_copy),
             "-movflags", "+faststart",
             str(out_path),
         ]
+    if shard:
+        pass_label = "Encoding (parallel shards)..."
+    elif pass_num == 0:
+        pass_label = "Encoding (GPU)..." if use_gpu else "Encoding..."
+    elif pass_num == 1:
+        pass_label = "Pass 1..."
+    else:
+        pass_label = "Pass 2 (final)..."
 
-    def parse_progress(line: str) -> Optional[float]:
-        m = re.search(r"out_time_ms=(\d+)", line)
-        if m:
-            return int(m.group(1)) / 1_000_000.0
-        return None
-
-    last_percent = 0.0
+    last_percent_x100 = -1
+    # One pipe for progress and stderr (-loglevel error keeps the latter to real problems): no second pipe or
+    # drain thread, and FFmpeg can't stall on an unread stderr buffer. Binary and unbuffered: the loop below
+    # os.read()s the fd directly and only the error tail is ever decoded.
     proc = subprocess.Popen(
         cmd,
         stdout=subprocess.PIPE,
-        stderr=subprocess.PIPE,
-        text=True,
-        bufsize=1,
+        stderr=subprocess.STDOUT,
+        bufsize=0,
+        **_SPAWN_KWARGS,
     )
+    stderr_tail: deque[bytes] = deque(maxlen=STDERR_TAIL_LINES)
 
+    fd = proc.stdout.fileno()
+    buf = bytearray()
+    # Without a callback or a duration only progress=end matters: skip looking up out_time_ms altogether
+    need_time = bool(progress_callback and duration_sec and duration_sec > 0)
+    # os.read blocks in the kernel until FFmpeg writes (no readline()/poll() spinning); b"" means EOF.
+    # Read to EOF even after progress=end: error messages can follow the last block.
     while True:
-        line = proc.stdout.readline()
-        if not line and proc.poll() is not None:
+        chunk = os.read(fd, PROGRESS_READ_SIZE)
+        if not chunk:
             break
-        line = line.strip()
-        if not line:
+        buf += chunk
+        # Only look at complete progress blocks, and only at the newest one; keep the partial tail for the next read
+        frame_start = buf.rfind(b"progress=")
+        frame_end = buf.find(b"\n", frame_start) if frame_start >= 0 else -1
+        if frame_end < 0:
             continue
-        dur = duration_sec
-        if dur is None:
-            dm = re.search(r"duration=([\d.]+)", line)
-            if dm:
-                dur = float(dm.group(1))
-        out_sec = parse_progress(line)
-        if progress_callback and dur and dur > 0 and out_sec is not None:
-            p = min(1.0, out_sec / dur)
+        out_us = None
+        if need_time:
+            # Lines are strict key=value: jump straight to the block's out_time_ms, no per-line scan of other keys
+            key_start = buf.rfind(b"out_time_ms=", 0, frame_start)
+            if key_start >= 0:
+                value = bytes(buf[key_start + 12:buf.find(b"\n", key_start)]).rstrip()
+                if value.isdigit():
+                    out_us = int(value)
+        for line in bytes(buf[:frame_end + 1]).splitlines(keepends=True):
+            if line.partition(b"=")[0] not in _PROGRESS_KEYS and not line.startswith(b"stream_"):
+                stderr_tail.append(line)
+        del buf[:frame_end + 1]
+        if out_us is not None:
+            p = min(1.0, out_us / 1_000_000.0 / duration_sec)
             percent = pass_offset + p * pass_weight * 100.0
-            if percent >= last_percent:
-                progress_callback(min(100.0, percent), "Pass 1..." if pass_num == 1 else "Pass 2 (final)...")
-                last_percent = percent
+            # Compare in hundredths of a percent; only report when it moved
+            percent_x100 = int(percent * 100)
+            if percent_x100 > last_percent_x100:
+                progress_callback(min(100.0, percent), pass_label)
+                last_percent_x100 = percent_x100
+    # Whatever follows the last progress block (e.g. the reason FFmpeg stopped) is stderr
+    stderr_tail.extend(bytes(buf).splitlines(keepends=True))
+    proc.stdout.close()
+    proc.wait()
 
     if proc.returncode != 0:
-        err = proc.stderr.read() if proc.stderr else ""
-        raise RuntimeError(f"FFmpeg pass {pass_num} failed (code {proc.returncode}). {err.strip() or 'No details.'}")
+        err = b"".join(stderr_tail).decode("utf-8", "replace")
+        what = "shard encode" if shard else f"pass {pass_num}" if pass_num else "encode"
+        raise RuntimeError(f"FFmpeg {what} failed (code {proc.returncode}). {err.strip() or 'No details.'}")
+
+
+def _encode_x264(
+    ffmpeg: str,
+    input_path: Path,
+    filter_complex: str,
+    out: Path,
+    duration_sec: Optional[float],
+    progress_callback: Optional[callable],
+    video_bitrate: Optional[str],
+    output_size: tuple[int, int] = (OUTPUT_WIDTH, OUTPUT_HEIGHT),
+    threads: Optional[int] = None,
+    hwaccel: Optional[str] = None,
+    audio_copy: bool = False,
+    pass1_filter_complex: Optional[str] = None,
+) -> None:
+    """
+    libx264 encode of filter_complex into out. Two-pass (pass 1 → 0–50%, pass 2 → 50–100%) when a target
+    bitrate must be hit over a long clip; single pass (0–100%) otherwise: CRF for Best quality (no target),
+    VBV-constrained ABR for clips shorter than SINGLE_PASS_MAX_DURATION_SEC (lands close enough to the target).
+    hwaccel: hardware decoder for every pass (see decode_hwaccel); None = software decode.
+    audio_copy: stream-copy the source audio into the final output.
+    pass1_filter_complex: cheaper graph for pass 1 (same output size, PASS1_SCALE_FLAGS); None = filter_complex.
+    """
+    if video_bitrate is None or (duration_sec is not None and duration_sec < SINGLE_PASS_MAX_DURATION_SEC):
+        if progress_callback:
+            progress_callback(0.0, "Encoding (single pass)...")
+        _run_ffmpeg_pass(
+            ffmpeg,
+            input_path,
+            filter_complex,
+            out_path=out,
+            pass_num=0,
+            duration_sec=duration_sec,
+            progress_callback=progress_callback,
+            video_bitrate=video_bitrate,
+            output_size=output_size,
+            threads=threads,
+            hwaccel=hwaccel,
+            audio_copy=audio_copy,
+        )
+        return
+
+    # Pass 2 rate control reads the whole pass-1 stats file before its first frame, so the passes cannot share one
+    # decode (split to two outputs, or a raw-YUV pipe, would have to hold every filtered frame until pass 1 ends).
+    # Each pass re-decodes; run(hwaccel_decode=True) can move that off the CPU, and short clips skip pass 1 altogether.
+    # Two-pass encode: passlogfile next to the output under a per-job random tag; a PID is not enough because
+    # run_batch/run_panels run several jobs in one process, and clip.mov/clip.mp4 share a stem (cleaned up after)
+    passlog_prefix = str(out.parent / f"{out.stem}_2pass_{uuid.uuid4().hex}")
+
+    if progress_callback:
+        progress_callback(0.0, "Pass 1 (analysis)...")
+
+    try:
+        _run_ffmpeg_pass(
+            ffmpeg,
+            input_path,
+            pass1_filter_complex or filter_complex,
+            out_path=None,
+            pass_num=1,
+            duration_sec=duration_sec,
+            progress_callback=progress_callback,
+            pass_weight=0.5,
+            pass_offset=0.0,
+            passlogfile_prefix=passlog_prefix,
+            video_bitrate=video_bitrate,
+            output_size=output_size,
+            threads=threads,
+            hwaccel=hwaccel,
+        )
+
+        if progress_callback:
+            progress_callback(50.0, "Pass 2 (final encode)...")
+
+        _run_ffmpeg_pass(
+            ffmpeg,
+            input_path,
+            filter_complex,
+            out_path=out,
+            pass_num=2,
+            duration_sec=duration_sec,
+            progress_callback=progress_callback,
+            pass_weight=0.5,
+            pass_offset=50.0,
+            passlogfile_prefix=passlog_prefix,
+            video_bitrate=video_bitrate,
+            output_size=output_size,
+            threads=threads,
+            hwaccel=hwaccel,
+            audio_copy=audio_copy,
+        )
+    finally:
+        # Remove this call's two-pass log files (<prefix>-0.log, .mbtree, .temp) with one scandir prefix test; the
+        # prefix is unique per call, so concurrent jobs writing to the same folder (run_batch, run_panels or another
+        # process) keep their logs
+        prefix = Path(passlog_prefix).name + "-"
+        with os.scandir(out.parent) as entries:
+            for entry in entries:
+                if entry.name.startswith(prefix) and ".log" in entry.name:
+                    try:
+                        os.unlink(entry.path)
+                    except OSError:
+                        pass
+
+
+def _averaged_progress(
+    progress_callback: Optional[callable], count: int, scale: float = 1.0, message: Optional[str] = None
+) -> Callable[[int], Optional[callable]]:
+    """
+    Combine the progress of `count` concurrent workers: returns a factory whose per-worker callbacks report the
+    average percent × scale to progress_callback, with `message` (None = the worker's own). The callback runs under
+    the lock, so totals arrive in order and the bar never steps back. The factory returns None without a callback.
+    """
+    lock = threading.Lock()
+    percents = [0.0] * count
+
+    def worker_progress(index: int) -> Optional[callable]:
+        if not progress_callback:
+            return None
+
+        def callback(percent: float, worker_message: str) -> None:
+            with lock:
+                percents[index] = percent
+                progress_callback(sum(percents) / count * scale, message or worker_message)
+        return callback
+
+    return worker_progress
+
+
+def _encode_x264_sharded(
+    ffmpeg: str,
+    input_path: Path,
+    filter_complex: str,
+    out: Path,
+    duration_sec: float,
+    progress_callback: Optional[callable],
+    video_bitrate: Optional[str],
+    shards: int,
+    hwaccel: Optional[str] = None,
+    audio_copy: bool = False,
+) -> None:
+    """
+    libx264 encode split into `shards` equal time spans encoded at once (single pass each: CRF, or VBV-constrained
+    ABR at video_bitrate), then joined with the concat protocol and muxed with the source audio (shards → 0–95%,
+    join → 95–100%). Every shard starts with an IDR frame and x264 GOPs are closed, so the join is a stream copy.
+    The filter graph has no temporal state, so the output matches a single encode apart from rate control.
+    """
+    shard_len = duration_sec / shards
+    # Boundaries rounded once to the ms that -ss/-t carry, so each shard ends exactly where the next one starts
+    # and every frame lands in exactly one shard (rounding start and length separately can drop or repeat one)
+    starts = [round(i * shard_len, 3) for i in range(shards)]
+    threads = max(1, (os.cpu_count() or 1) // shards)
+    shard_dir = Path(tempfile.mkdtemp(prefix=out.stem + "_shards_", dir=out.parent))
+    shard_paths = [shard_dir / f"shard_{i}.ts" for i in range(shards)]
+
+    shard_progress = _averaged_progress(progress_callback, shards, scale=0.95)
+
+    def encode_shard(index: int) -> None:
+        _run_ffmpeg_pass(
+            ffmpeg,
+            input_path,
+            filter_complex,
+            out_path=shard_paths[index],
+            pass_num=0,
+            duration_sec=shard_len,
+            progress_callback=shard_progress(index),
+            video_bitrate=video_bitrate,
+            threads=threads,
+            hwaccel=hwaccel,
+            # The last shard runs to the end of the input, whatever the rounding of shard_len
+            shard=(starts[index], starts[index + 1] - starts[index] if index < shards - 1 else duration_sec),
+        )
+
+    try:
+        if progress_callback:
+            progress_callback(0.0, f"Encoding ({shards} parallel shards)...")
+        with ThreadPoolExecutor(max_workers=shards) as pool:
+            list(pool.map(encode_shard, range(shards)))
+
+        if progress_callback:
+            progress_callback(95.0, "Joining shards...")
+        cmd = [
+            ffmpeg,
+            "-y",
+            "-hide_banner",
+            "-loglevel", "error",
+            "-i", "concat:" + "|".join(str(p) for p in shard_paths),
+            "-i", str(input_path),
+            "-map", "0:v",
+            "-map", "1:a?",
+            "-c:v", "copy",
+            *audio_args(audio_copy),
+            "-movflags", "+faststart",
+            str(out),
+        ]
+        result = subprocess.run(cmd, capture_output=True, **_SPAWN_KWARGS)
+        if result.returncode != 0:
+            err = result.stderr.decode("utf-8", "replace").strip()
+            raise RuntimeError(f"FFmpeg shard join failed (code {result.returncode}). {err or 'No details.'}")
+    finally:
+        shutil.rmtree(shard_dir, ignore_errors=True)
+
+
+def _retry_in_software(
+    encode: Callable[[Optional[str]], None], hwaccel: Optional[str], progress_callback: Optional[callable]
+) -> None:
+    """Run encode(hwaccel); if a hardware decoder was used and FFmpeg failed, run encode(None) once (CPU decode)."""
+    if not hwaccel:
+        encode(None)
+        return
+    try:
+        encode(hwaccel)
+    except RuntimeError:
+        if progress_callback:
+            progress_callback(0.0, f"Hardware decode ({hwaccel}) failed; retrying with CPU decode...")
+        encode(None)
+
+
+def _prepare(
+    input_path: Union[str, Path],
+    output_path_arg: Optional[Union[str, Path]],
+    top_bezel_px: int,
+    bottom_bezel_px: int,
+    ffmpeg_path: Optional[str],
+) -> tuple[Path, Path, FfmpegTools]:
+    """Validate a job; return (resolved input, output path with parent created, resolved FFmpeg tools)."""
+    input_path = Path(input_path).resolve()
+    if not input_path.is_file():
+        raise FileNotFoundError(f"Input file not found: {input_path}")
+
+    out = Path(output_path_arg).resolve() if output_path_arg else output_path(input_path)
+    out.parent.mkdir(parents=True, exist_ok=True)
+
+    tools = resolve_tools(ffmpeg_path)
+
+    if top_bezel_px < 0 or bottom_bezel_px < 0:
+        raise ValueError("top_bezel_px and bottom_bezel_px must be >= 0")
+    if top_bezel_px + bottom_bezel_px >= PANEL_WIDTH:
+        raise ValueError(f"top_bezel_px + bottom_bezel_px must be < {PANEL_WIDTH}")
+    return input_path, out, tools
 
 
 def run(
@@ -361,104 +1315,222 @@ def run(
     target_size_mb: Optional[float] = None,
     ffmpeg_path: Optional[str] = None,
     progress_callback: Optional[callable] = None,
+    encoder: str = "libx264",
+    gpu_decode: bool = True,
+    hevc_10bit: bool = False,
+    threads: Optional[int] = None,
+    parallel_shards: int = 1,
+    hwaccel_decode: bool = False,
 ) -> Path:
     """
-    Run bezel removal: map input to 4 portrait panels, crop bezels, hstack, scale to 4320×1920 (same aspect as destination 8640×3840), then two-pass H.264 encode.
+    Run bezel removal: map input to 4 portrait panels, crop bezels, hstack, scale to 4320×1920 (same aspect as destination 8640×3840), then H.264 encode
+    (two-pass for target sizes; single pass for Best quality and clips under SINGLE_PASS_MAX_DURATION_SEC).
     If target_size_mb is set (e.g. 200), video bitrate is chosen so the output file stays at or under that size.
     Output fills 8640×3840 desktop correctly. Input layout is auto-detected:
     - Horizontal composite (width ≥ height, e.g. 8640×3840): 4 vertical strips → panels left to right.
     - Vertical stack (height > width, e.g. 3840×8640): 4 horizontal bands → rotate each 90° CCW → panels left to right.
     Portrait: top bezel = left edge of strip, bottom bezel = right edge (px).
     progress_callback(percent: float, message: str) is called with 0.0–100.0 and status.
+    encoder: "libx264" (default: 10-bit 4:2:2 High422, two-pass for target sizes, see _encode_x264), "nvenc" (NVIDIA:
+    CUDA decode, one 8-bit 4:2:0 hevc_nvenc invocation with internal multipass at the same bitrate) or "auto"
+    (nvenc only when a test encode succeeds, see nvenc_usable; note the different output format).
+    gpu_decode: decode in hardware. With nvenc, CUDA frames stay on the GPU up to the crop, but only when
+    nvdec_can_decode() accepts the input's codec and size (otherwise FFmpeg fails or silently produces an
+    empty/corrupt output); other inputs are decoded on the CPU.
+    hevc_10bit: with nvenc, encode 10-bit HEVC (hevc_nvenc Main10, constant quality; target_size_mb is ignored).
+    Check that get_nvenc_encoders() includes hevc_nvenc first.
+    threads: libx264 thread count (see run_batch); None = x264 default.
+    hwaccel_decode: with libx264, decode with decode_hwaccel's hardware decoder (videotoolbox/cuda/vaapi) instead of
+    the CPU; off by default. If that encode fails it is redone once with CPU decode.
+    parallel_shards: with libx264, encode up to this many time spans of the input at once and join them
+    (see _encode_x264_sharded; e.g. cpu_count // CORES_PER_ENCODE). Each shard is at least SHARD_MIN_DURATION_SEC;
+    target sizes use single-pass ABR per shard, so they land less exactly than two-pass.
     Returns path to the output file.
     """
-    input_path = Path(input_path).resolve()
-    if not input_path.is_file():
-        raise FileNotFoundError(f"Input file not found: {input_path}")
-
-    out = Path(output_path_arg).resolve() if output_path_arg else output_path(input_path)
-    out.parent.mkdir(parents=True, exist_ok=True)
-
-    ffmpeg = ffmpeg_path or get_ffmpeg_path()
-    if not ffmpeg:
-        raise RuntimeError("FFmpeg not found. Please install FFmpeg and add it to your PATH.")
-
-    if top_bezel_px < 0 or bottom_bezel_px < 0:
-        raise ValueError("top_bezel_px and bottom_bezel_px must be >= 0")
-    if top_bezel_px + bottom_bezel_px >= PANEL_WIDTH:
-        raise ValueError(f"top_bezel_px + bottom_bezel_px must be < {PANEL_WIDTH}")
-
-    ffprobe_path = None
-    if ffmpeg_path:
-        parent = Path(ffmpeg_path).parent
-        ffprobe_name = "ffprobe.exe" if sys.platform == "win32" else "ffprobe"
-        ffprobe_path = str(parent / ffprobe_name)
+    input_path, out, tools = _prepare(input_path, output_path_arg, top_bezel_px, bottom_bezel_px, ffmpeg_path)
+    ffmpeg = tools.ffmpeg
 
     # Choose filter by input layout: horizontal composite (8640×3840) vs vertical stack (3840×8640).
     # Panels: portrait 2160×3840 each; horizontal row = 8640×3840.
-    size = get_video_size(input_path, ffprobe_path=ffprobe_path)
+    size, duration_sec, codec, audio_copy = get_video_info(input_path, ffprobe_path=tools.ffprobe)
+    # GPU path: FFmpeg has no CUDA crop/hstack, so those run on the downloaded frame; the downscale runs on the GPU when possible
+    use_gpu = resolve_encoder(encoder, ffmpeg) == "nvenc"
+    cuda_scale = use_gpu and "scale_cuda" in get_ffmpeg_filters(ffmpeg)
+    hw_decode = use_gpu and gpu_decode and nvdec_can_decode(codec, size, get_nvdec_codecs(ffmpeg))
+    # libx264 path: the 8640×3840 decode alone can bottleneck the CPU; hand it to the GPU/ASIC when asked to
+    hwaccel = decode_hwaccel(ffmpeg, codec, size) if hwaccel_decode and not use_gpu else None
+    hevc_10bit = use_gpu and hevc_10bit
+    hw = {
+        "hw_download": hw_decode,
+        "hw_upload": use_gpu,
+        "cuda_scale": cuda_scale,
+        "hw_format": "p010le" if hevc_10bit else "nv12",
+    }
     if size and size[1] > size[0]:
         # Tall input → vertical stack: 4 bands (3840×2160), rotate each 90° CCW, crop, hstack
-        filter_complex = build_filter_vertical(top_bezel_px, bottom_bezel_px)
+        build_filter = build_filter_vertical
     else:
         # Wide or square input → horizontal composite: 4 vertical strips, crop, hstack
-        filter_complex = build_filter_horizontal(top_bezel_px, bottom_bezel_px)
-
-    duration_sec = get_duration_seconds(input_path, ffprobe_path=ffprobe_path)
+        build_filter = build_filter_horizontal
+    filter_complex = build_filter(top_bezel_px, bottom_bezel_px, **hw)
 
     # Video bitrate: from target file size (if set) or default
     video_bitrate: Optional[str] = None
     if target_size_mb is not None and target_size_mb > 0 and duration_sec and duration_sec > 0:
         video_bitrate = video_bitrate_for_target_size_mb(target_size_mb, duration_sec)
 
-    # Two-pass encode: shared passlogfile in output dir (cleaned up after)
-    passlog_prefix = str(out.parent / (out.stem + "_2pass"))
+    if progress_callback and size:
+        progress_callback(0.0, f"Input: {size[0]}×{size[1]} → Output: {OUTPUT_WIDTH}×{OUTPUT_HEIGHT}")
 
-    if progress_callback:
-        if size:
-            progress_callback(0.0, f"Input: {size[0]}×{size[1]} → Output: {OUTPUT_WIDTH}×{OUTPUT_HEIGHT}")
-        progress_callback(0.0, "Pass 1 (analysis)...")
-
-    _run_ffmpeg_pass(
-        ffmpeg,
-        input_path,
-        filter_complex,
-        out_path=None,
-        pass_num=1,
-        duration_sec=duration_sec,
-        progress_callback=progress_callback,
-        pass_weight=0.5,
-        pass_offset=0.0,
-        passlogfile_prefix=passlog_prefix,
-        video_bitrate=video_bitrate,
-    )
-
-    if progress_callback:
-        progress_callback(50.0, "Pass 2 (final encode)...")
-
-    try:
+    if use_gpu:
+        # NVENC multipass runs inside one invocation (no libx264-style stats file): 0–100%
+        if progress_callback:
+            progress_callback(0.0, "Encoding (GPU)...")
         _run_ffmpeg_pass(
             ffmpeg,
             input_path,
             filter_complex,
             out_path=out,
-            pass_num=2,
+            pass_num=0,
             duration_sec=duration_sec,
             progress_callback=progress_callback,
-            pass_weight=0.5,
-            pass_offset=50.0,
-            passlogfile_prefix=passlog_prefix,
             video_bitrate=video_bitrate,
+            use_gpu=True,
+            hw_decode=hw_decode,
+            hevc_10bit=hevc_10bit,
+            audio_copy=audio_copy,
+        )
+        if progress_callback:
+            progress_callback(100.0, "Done.")
+        return out
+
+    shards = min(parallel_shards, int(duration_sec // SHARD_MIN_DURATION_SEC)) if duration_sec else 1
+    if shards > 1:
+        # Independent time spans, each its own encode with cpu_count // shards threads
+        _retry_in_software(
+            lambda hw: _encode_x264_sharded(
+                ffmpeg, input_path, filter_complex, out, duration_sec, progress_callback, video_bitrate, shards,
+                hwaccel=hw, audio_copy=audio_copy,
+            ),
+            hwaccel,
+            progress_callback,
+        )
+    else:
+        _retry_in_software(
+            lambda hw: _encode_x264(
+                ffmpeg, input_path, filter_complex, out, duration_sec, progress_callback, video_bitrate,
+                threads=threads, hwaccel=hw, audio_copy=audio_copy,
+                pass1_filter_complex=build_filter(top_bezel_px, bottom_bezel_px, scale_flags=PASS1_SCALE_FLAGS),
+            ),
+            hwaccel,
+            progress_callback,
         )
-    finally:
-        # Remove two-pass log files
-        for f in out.parent.glob(out.stem + "_2pass*.log*"):
-            try:
-                f.unlink()
-            except OSError:
-                pass
 
     if progress_callback:
         progress_callback(100.0, "Done.")
 
     return out
+
+
+def run_panels(
+    input_path: Union[str, Path],
+    output_path_arg: Optional[Union[str, Path]] = None,
+    top_bezel_px: int = 16,
+    bottom_bezel_px: int = 21,
+    target_size_mb: Optional[float] = None,
+    ffmpeg_path: Optional[str] = None,
+    progress_callback: Optional[callable] = None,
+    max_parallel: Optional[int] = None,
+) -> list[Path]:
+    """
+    CPU alternative to run() for many-core machines when each display plays its own file:
+    encode every panel as a separate PANEL_OUTPUT_WIDTH×OUTPUT_HEIGHT video (libx264, see _encode_x264).
+    Panels are independent, so up to max_parallel FFmpeg processes run at once
+    (default cpu_count // CORES_PER_ENCODE, 1..PANEL_COUNT), each encoding a quarter-width frame.
+    Cost: every process decodes the full 8640×3840 input (PANEL_COUNT software decodes, twice each for two-pass),
+    so this only pays off when the cores would otherwise sit idle. Decode stays on the CPU: one hardware decode
+    session per panel would exhaust the decoder's session/memory budget.
+    target_size_mb applies to each panel file. progress_callback gets the average over all panels.
+    Returns the per-panel paths (output_panel_path of the run() output path), Display 1 first.
+    """
+    input_path, out, tools = _prepare(input_path, output_path_arg, top_bezel_px, bottom_bezel_px, ffmpeg_path)
+    ffmpeg = tools.ffmpeg
+
+    size, duration_sec, _, audio_copy = get_video_info(input_path, ffprobe_path=tools.ffprobe)
+    vertical = bool(size and size[1] > size[0])
+    video_bitrate: Optional[str] = None
+    if target_size_mb is not None and target_size_mb > 0 and duration_sec and duration_sec > 0:
+        video_bitrate = video_bitrate_for_target_size_mb(target_size_mb, duration_sec)
+
+    if max_parallel is None:
+        max_parallel = (os.cpu_count() or 1) // CORES_PER_ENCODE
+    max_parallel = max(1, min(PANEL_COUNT, max_parallel))
+
+    # Each worker thread just supervises its own FFmpeg process; progress is averaged across panels
+    panel_progress = _averaged_progress(
+        progress_callback, PANEL_COUNT, message=f"Encoding {PANEL_COUNT} panels ({max_parallel} at a time)..."
+    )
+
+    def encode_panel(index: int) -> Path:
+        panel_out = output_panel_path(out, index)
+        _encode_x264(
+            ffmpeg,
+            input_path,
+            build_filter_panel(index, top_bezel_px, bottom_bezel_px, vertical),
+            panel_out,
+            duration_sec,
+            panel_progress(index),
+            video_bitrate,
+            output_size=(PANEL_OUTPUT_WIDTH, OUTPUT_HEIGHT),
+            threads=CORES_PER_ENCODE if max_parallel > 1 else None,
+            audio_copy=audio_copy,
+            pass1_filter_complex=build_filter_panel(
+                index, top_bezel_px, bottom_bezel_px, vertical, scale_flags=PASS1_SCALE_FLAGS
+            ),
+        )
+        return panel_out
+
+    with ThreadPoolExecutor(max_workers=max_parallel) as pool:
+        outputs = list(pool.map(encode_panel, range(PANEL_COUNT)))
+
+    if progress_callback:
+        progress_callback(100.0, "Done.")
+    return outputs
+
+
+def run_batch(
+    inputs: list[Union[str, Path]],
+    max_parallel: Optional[int] = None,
+    progress_callback: Optional[callable] = None,
+    **run_kwargs,
+) -> list[Path]:
+    """
+    Run bezel removal on several files, up to max_parallel at once (default cpu_count // CORES_PER_ENCODE, at least 1),
+    so one file's pass 1 overlaps another's pass 2. Each file gets its default output path; run_kwargs go to run()
+    (e.g. top_bezel_px, target_size_mb, encoder). With more than one job, libx264 gets -threads CORES_PER_ENCODE
+    per job so the total stays within the CPU. NVIDIA consumer cards limit concurrent NVENC sessions:
+    lower max_parallel or pass encoder="libx264" for large batches.
+    progress_callback gets the average over all files. Returns output paths in input order.
+    """
+    if not inputs:
+        return []
+    if max_parallel is None:
+        max_parallel = (os.cpu_count() or 1) // CORES_PER_ENCODE
+    max_parallel = max(1, min(len(inputs), max_parallel))
+    if max_parallel > 1:
+        run_kwargs.setdefault("threads", CORES_PER_ENCODE)
+
+    # Worker threads just supervise FFmpeg processes; the pool size caps how many run at once
+    file_progress = _averaged_progress(
+        progress_callback, len(inputs), message=f"Processing {len(inputs)} files ({max_parallel} at a time)..."
+    )
+
+    def run_one(index: int) -> Path:
+        return run(inputs[index], progress_callback=file_progress(index), **run_kwargs)
+
+    with ThreadPoolExecutor(max_workers=max_parallel) as pool:
+        outputs = list(pool.map(run_one, range(len(inputs))))
+
+    if progress_callback:
+        progress_callback(100.0, "Done.")
+    return outputs